@@ -7,6 +7,7 @@ from redbot.core import commands
 from redbot.core.commands import Context
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box
+from redbot.core.utils.predicates import MessagePredicate
 
 from ..mixins.abc import RaffleMixin
 from ..mixins.metaclass import MetaClass
@@ -14,7 +15,14 @@ from ..utils.converters import RaffleNameConverter
 from ..utils.enums import RaffleComponents
 from ..utils.exceptions import RaffleError
 from ..utils.formatting import cross, tick
-from ..utils.helpers import cleanup_code, format_traceback, getstrftime, number_suffix, validator
+from ..utils.helpers import (
+    cleanup_code,
+    format_traceback,
+    get_raffle_conditions,
+    getstrftime,
+    number_suffix,
+    validator,
+)
 from ..utils.parser import RaffleManager
 
 _ = Translator("Raffle", __file__)
@@ -35,8 +43,6 @@ class BuilderCommands(RaffleMixin, metaclass=MetaClass):
     @create.command(name="complex")
     async def _complex(self, ctx: Context):
         """Create a raffle with complex conditions."""
-        await ctx.trigger_typing()
-        check = lambda x: x.author == ctx.author and x.channel == ctx.channel
         message = _(
             "You're about to create a new raffle.\n"
             "Please consider reading the docs about the various "
@@ -44,12 +50,14 @@ class BuilderCommands(RaffleMixin, metaclass=MetaClass):
         )
 
         message += _("\n\n**Conditions Blocks:**") + box(
-            "\n".join(f"+ {e.name}" for e in RaffleComponents), lang="diff"
+            "\n".join(f"+ {name}" for name in RaffleComponents.__members__), lang="diff"
         )
         instruction_message = await ctx.send(message)
 
         try:
-            content = await self.bot.wait_for("message", timeout=500, check=check)
+            content = await self.bot.wait_for(
+                "message", timeout=500, check=MessagePredicate.same_context(ctx)
+            )
         except asyncio.TimeoutError:
             with contextlib.suppress(discord.NotFound):
                 await instruction_message.delete()
@@ -78,16 +86,14 @@ class BuilderCommands(RaffleMixin, metaclass=MetaClass):
 
             rafflename = valid.get("name").lower()
 
-            if rafflename in [x.lower() for x in raffle.keys()]:
+            if rafflename in raffle:
                 return await ctx.send(_("A raffle with this name already exists."))
 
-            datetimeinfo = _(
-                "{day} of {month}, {year} ({time})".format(
-                    day=number_suffix(getstrftime("d")),
-                    month=getstrftime("B"),
-                    year=getstrftime("Y"),
-                    time=getstrftime("X"),
-                )
+            datetimeinfo = _("{day} of {month}, {year} ({time})").format(
+                day=number_suffix(getstrftime("d")),
+                month=getstrftime("B"),
+                year=getstrftime("Y"),
+                time=getstrftime("X"),
             )
 
             data = {
@@ -96,29 +102,16 @@ class BuilderCommands(RaffleMixin, metaclass=MetaClass):
                 "created_at": datetimeinfo,
             }
 
-            conditions = {
-                "end_message": valid.get("end_message", None),
-                "join_message": valid.get("join_message", None),
-                "account_age": valid.get("account_age", None),
-                "server_join_age": valid.get("server_join_age", None),
-                "roles_needed_to_enter": valid.get("roles_needed_to_enter", None),
-                "badges_needed_to_enter": valid.get("badges_needed_to_enter", None),
-                "prevented_users": valid.get("prevented_users", None),
-                "allowed_users": valid.get("allowed_users", None),
-                "description": valid.get("description", None),
-                "maximum_entries": valid.get("maximum_entries", None),
-                "on_end_action": valid.get("on_end_action", None),
-                "suspense_timer": valid.get("suspense_timer", None),
-            }
+            conditions = get_raffle_conditions(valid)
 
             for k, v in conditions.items():
                 if v:
                     data[k] = v
 
             raffle[rafflename] = data
-            await ctx.send(tick(_("Raffle created with the name `{}`.".format(rafflename))))
+            await ctx.send(tick(_("Raffle created with the name `{}`.").format(rafflename)))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, rafflename)
 
     @create.command()
     async def simple(
@@ -133,16 +126,14 @@ class BuilderCommands(RaffleMixin, metaclass=MetaClass):
         raffle_name = raffle_name.lower()
         async with self.config.guild(ctx.guild).raffles() as raffle:
 
-            if raffle_name in [x.lower() for x in raffle.keys()]:
+            if raffle_name in raffle:
                 return await ctx.send(_("A raffle with this name already exists."))
 
-            datetimeinfo = _(
-                "{day} of {month}, {year} ({time})".format(
-                    day=number_suffix(getstrftime("d")),
-                    month=getstrftime("B"),
-                    year=getstrftime("Y"),
-                    time=getstrftime("X"),
-                )
+            datetimeinfo = _("{day} of {month}, {year} ({time})").format(
+                day=number_suffix(getstrftime("d")),
+                month=getstrftime("B"),
+                year=getstrftime("Y"),
+                time=getstrftime("X"),
             )
 
             data = {
@@ -155,5 +146,5 @@ class BuilderCommands(RaffleMixin, metaclass=MetaClass):
                 data["description"] = description
 
             raffle[raffle_name] = data
-        await ctx.send(tick(_("Raffle created with the name `{}`.".format(raffle_name))))
-        await self.clean_guild_raffles(ctx)
+        await ctx.send(tick(_("Raffle created with the name `{}`.").format(raffle_name)))
+        self.schedule_cleanup(ctx, raffle_name)
@@ -1,15 +1,13 @@
-import asyncio
-import contextlib
+from typing import Union
 
 import discord
 from redbot.core import commands
 from redbot.core.i18n import Translator
-from redbot.core.utils.menus import start_adding_reactions
-from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 
 from ...mixins.abc import RaffleMixin
 from ...mixins.metaclass import MetaClass
-from ...utils.converters import RaffleFactoryConverter
+from ...utils.converters import RaffleFactoryConverter, fetch_raffle_or_report
+from ...utils.helpers import yes_or_no_prompt
 
 _ = Translator("Raffle", __file__)
 
@@ -39,92 +37,85 @@ class Allowed(RaffleMixin, metaclass=MetaClass):
             - `<raffle>` - The name of the raffle.
             - `<member>` - The member to add to the allowed list.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffles = self.config.guild(ctx.guild).raffles
+        async with raffles.get_lock():
+            raffle_data = await fetch_raffle_or_report(ctx, raffles, raffle)
+            if raffle_data is None:
+                return
 
             allowed = raffle_data.get("allowed_users", [])
 
             if member.id in allowed:
                 return await ctx.send(_("This user is already allowed in this raffle."))
 
-            if not allowed:
-                raffle_data["allowed_users"] = [member.id]
-            else:
-                allowed.append(member.id)
+            allowed.append(member.id)
+            await raffles.set_raw(raffle, "allowed_users", value=allowed)
 
-            await ctx.send(_("{} added to the allowed list for this raffle.".format(member.name)))
+        await ctx.send(_("{} added to the allowed list for this raffle.").format(member.name))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @allowed.command(name="remove", aliases=["del"])
-    async def allowed_remove(self, ctx, raffle: RaffleFactoryConverter, member: discord.Member):
+    async def allowed_remove(
+        self, ctx, raffle: RaffleFactoryConverter, member: Union[discord.Member, int]
+    ):
         """Remove a member from the allowed list of a raffle.
 
+        Users who have left the guild can be removed by their ID.
+
         **Arguments:**
             - `<raffle>` - The name of the raffle.
-            - `<member>` - The member to remove from the allowed list.
+            - `<member>` - The member, or user ID, to remove from the allowed list.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffles = self.config.guild(ctx.guild).raffles
+        async with raffles.get_lock():
+            raffle_data = await fetch_raffle_or_report(ctx, raffles, raffle)
+            if raffle_data is None:
+                return
 
             allowed = raffle_data.get("allowed_users", [])
 
-            if member.id not in allowed:
+            try:
+                allowed.remove(getattr(member, "id", member))
+            except ValueError:
                 return await ctx.send(_("This user was not already allowed in this raffle."))
 
-            allowed.remove(member.id)
-            if not allowed:
-                del raffle_data["allowed_users"]
-            await ctx.send(
-                _("{} removed from the allowed list for this raffle.".format(member.name))
+            if allowed:
+                await raffles.set_raw(raffle, "allowed_users", value=allowed)
+            else:
+                await raffles.clear_raw(raffle, "allowed_users")
+
+        await ctx.send(
+            _("{} removed from the allowed list for this raffle.").format(
+                getattr(member, "name", member)
             )
+        )
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @allowed.command(name="clear")
     async def allowed_clear(self, ctx, raffle: RaffleFactoryConverter):
         """Clear the allowed list for a raffle."""
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
-
-            allowed = raffle_data.get("allowed_users", None)
+        raffles = self.config.guild(ctx.guild).raffles
+        allowed = await raffles.get_raw(raffle, "allowed_users", default=None)
 
-            if allowed is None:
-                return await ctx.send(_("There are no allowed users."))
+        if allowed is None:
+            return await ctx.send(_("There are no allowed users."))
 
         message = _("Are you sure you want to clear the allowed list for this raffle?")
-        can_react = ctx.channel.permissions_for(ctx.me).add_reactions
-        if not can_react:
-            message += " (y/n)"
-        message = await ctx.send(message)
-        if can_react:
-            start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
-            predicate = ReactionPredicate.yes_or_no(message, ctx.author)
-            event_type = "reaction_add"
-        else:
-            predicate = MessagePredicate.yes_or_no(ctx)
-            event_type = "message"
-
-        try:
-            await self.bot.wait_for(event_type, check=predicate, timeout=30)
-        except asyncio.TimeoutError:
+        message, confirmed = await yes_or_no_prompt(ctx, message)
+        if confirmed is None:
             await ctx.send(_("You took too long to respond."))
             return
 
-        if predicate.result:
-            with contextlib.suppress(KeyError):
-                # Still wanna remove empty list here
-                del raffle_data["allowed_users"]
+        if confirmed:
+            await raffles.clear_raw(raffle, "allowed_users")
             msg = _("Allowed list cleared for this raffle.")
             try:
                 await message.edit(content=msg)
             except discord.NotFound:
                 await ctx.send(msg)
+            self.schedule_cleanup(ctx, raffle)
 
         else:
             await ctx.send(_("No changes have been made."))
-
-        await self.clean_guild_raffles(ctx)
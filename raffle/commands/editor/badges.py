@@ -5,7 +5,7 @@ from redbot.core.utils.chat_formatting import inline
 from ...mixins.abc import RaffleMixin
 from ...mixins.metaclass import MetaClass
 from ...utils.checks import VALID_USER_BADGES
-from ...utils.converters import RaffleFactoryConverter
+from ...utils.converters import RaffleFactoryConverter, report_missing_raffle
 from ...utils.helpers import format_underscored_text
 
 _ = Translator("Raffle", __file__)
@@ -39,20 +39,20 @@ class Badges(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             badges_list = raffle_data.get("badges_needed_to_enter", [])
 
             for badge in badges:
                 if badge not in VALID_USER_BADGES:
                     return await ctx.send(
-                        _('"{}" was not a recognized Discord badge.'.format(badge))
+                        _('"{}" was not a recognized Discord badge.').format(badge)
                     )
                 if badge in badges_list:
                     return await ctx.send(
-                        _(
-                            'The "{}" badge is already required in this raffle.'.format(
-                                format_underscored_text(badge)
-                            )
+                        _('The "{}" badge is already required in this raffle.').format(
+                            format_underscored_text(badge)
                         )
                     )
 
@@ -62,14 +62,12 @@ class Badges(RaffleMixin, metaclass=MetaClass):
                     badges_list.append(badge)
 
             await ctx.send(
-                _(
-                    "Added the following badges as requirements in this raffle: {}.".format(
-                        ", ".join(inline(format_underscored_text(b)) for b in badges)
-                    )
+                _("Added the following badges as requirements in this raffle: {}.").format(
+                    ", ".join(inline(format_underscored_text(b)) for b in badges)
                 )
             )
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @badges.command(name="remove", aliases=["del"])
     async def badges_remove(self, ctx, raffle: RaffleFactoryConverter, *badges: str):
@@ -82,31 +80,31 @@ class Badges(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             badges_list = raffle_data.get("badges_needed_to_enter", [])
 
             for badge in badges:
                 if badge not in VALID_USER_BADGES:
                     return await ctx.send(
-                        _('"{}" was not a recognized Discord badge.'.format(badge))
+                        _('"{}" was not a recognized Discord badge.').format(badge)
                     )
                 if badge not in badges_list:
                     return await ctx.send(
-                        _('The "{}" badge was not already required in this raffle.'.format(badge))
+                        _('The "{}" badge was not already required in this raffle.').format(badge)
                     )
 
             badges_list.remove(badge)
             if not badges_list:
                 del raffle_data["badges_list"]
             await ctx.send(
-                _(
-                    "Added the following badges as requirements in this raffle: {}.".format(
-                        ", ".join(inline(format_underscored_text(b)) for b in badges)
-                    )
+                _("Added the following badges as requirements in this raffle: {}.").format(
+                    ", ".join(inline(format_underscored_text(b)) for b in badges)
                 )
             )
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @badges.command(name="clear")
     async def badges_clear(self, ctx, raffle: RaffleFactoryConverter):
@@ -118,6 +116,8 @@ class Badges(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             badges_list = raffle_data.get("badges_needed_to_enter", None)
 
@@ -6,21 +6,26 @@ import discord
 from redbot.core import commands
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box
-from redbot.core.utils.menus import start_adding_reactions
-from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
+from redbot.core.utils.predicates import MessagePredicate
 
 from ...mixins.abc import RaffleMixin
 from ...mixins.metaclass import MetaClass
-from ...utils.converters import RaffleFactoryConverter
-from ...utils.enums import RaffleComponents
+from ...utils.converters import (
+    RaffleFactoryConverter,
+    fetch_raffle_or_report,
+    report_missing_raffle,
+)
 from ...utils.exceptions import InvalidArgument, RaffleError
-from ...utils.formatting import cross, tick
+from ...utils.formatting import cross, quote, tick
 from ...utils.helpers import (
+    RAFFLE_CONDITIONS,
     cleanup_code,
     format_traceback,
+    get_raffle_conditions,
     raffle_safe_member_scanner,
     start_interactive_message_session,
     validator,
+    yes_or_no_prompt,
 )
 from ...utils.parser import RaffleManager
 
@@ -52,11 +57,12 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             if isinstance(new_account_age, bool):
                 if not new_account_age:
-                    with contextlib.suppress(KeyError):
-                        del raffle_data["account_age"]
+                    raffle_data.pop("account_age", None)
                     return await ctx.send(_("Account age requirement removed from this raffle."))
                 else:
                     return await ctx.send(
@@ -71,7 +77,7 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
             raffle_data["account_age"] = new_account_age
             await ctx.send(_("Account age requirement updated for this raffle."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def convertsimple(self, ctx, raffle: RaffleFactoryConverter):
@@ -80,48 +86,29 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         **Arguments**
             - `<raffle>` - The name of the raffle.
         """
-        components = [e.name for e in RaffleComponents][2:]
-
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
-
-            message = _(
-                ":warning: Are you sure you want to convert this raffle to a simple raffle?\n"
-                "It will remove all the conditions!"
-            )
-
-            can_react = ctx.channel.permissions_for(ctx.me).add_reactions
-            if not can_react:
-                message += " (y/n)"
-            message = await ctx.send(message)
+        components = [k for k in RAFFLE_CONDITIONS if k != "description"]
 
-            if can_react:
-                start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
-                predicate = ReactionPredicate.yes_or_no(message, ctx.author)
-                event_type = "reaction_add"
-            else:
-                predicate = MessagePredicate.yes_or_no(ctx)
-                event_type = "message"
+        message = _(
+            ":warning: Are you sure you want to convert this raffle to a simple raffle?\n"
+            "It will remove all the conditions!"
+        )
 
-            try:
-                await self.bot.wait_for(event_type, check=predicate, timeout=30)
-            except asyncio.TimeoutError:
-                await ctx.send(_("You took too long to respond."))
-
-            if predicate.result:
-                delkeys = []
-                for k in raffle_data.keys():
-                    if k in components:
-                        delkeys.append(k)
-                for k in delkeys:
-                    del raffle_data[k]
-                await ctx.send(_("Raffle converted to simple raffle."))
+        message, confirmed = await yes_or_no_prompt(ctx, message)
+        if confirmed is None:
+            await ctx.send(_("You took too long to respond."))
 
-            else:
-                await ctx.send(_("No changes have been made."))
+        if confirmed:
+            async with self.config.guild(ctx.guild).raffles() as r:
+                raffle_data = r.get(raffle, None)
+                if raffle_data is None:
+                    return await report_missing_raffle(ctx, raffle)
+                for k in components:
+                    raffle_data.pop(k, None)
+            await ctx.send(_("Raffle converted to simple raffle."))
+            self.schedule_cleanup(ctx, raffle)
 
-        await self.clean_guild_raffles(ctx)
+        else:
+            await ctx.send(_("No changes have been made."))
 
     @edit.command()
     async def serverjoinage(
@@ -138,10 +125,11 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             if not new_server_join_age:
-                with contextlib.suppress(KeyError):
-                    del raffle_data["server_join_age"]
+                raffle_data.pop("server_join_age", None)
                 return await ctx.send(_("Server join age requirement removed from this raffle."))
 
             elif new_server_join_age is True:
@@ -158,7 +146,7 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
                 raffle_data["server_join_age"] = new_server_join_age
                 await ctx.send(_("Server join age requirement updated for this raffle."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def description(
@@ -175,10 +163,11 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             if not description:
-                with contextlib.suppress(KeyError):
-                    del raffle_data["description"]
+                raffle_data.pop("description", None)
                 return await ctx.send(_("Description removed from this raffle."))
 
             elif description is True:
@@ -190,7 +179,7 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
                 raffle_data["description"] = description
                 await ctx.send(_("Description updated for this raffle."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def stimer(self, ctx, raffle: RaffleFactoryConverter, suspense_timer: Union[int, bool]):
@@ -206,10 +195,11 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             if not suspense_timer:
-                with contextlib.suppress(KeyError):
-                    del raffle_data["suspense_timer"]
+                raffle_data.pop("suspense_timer", None)
                 return await ctx.send(_("Suspense timer reset to the default: 2 seconds."))
 
             elif suspense_timer is True:
@@ -223,7 +213,7 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
                 raffle_data["suspense_timer"] = suspense_timer
                 await ctx.send(_("Suspense timer updated for this raffle."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def endaction(
@@ -240,10 +230,11 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             if not on_end_action:
-                with contextlib.suppress(KeyError):
-                    del raffle_data["on_end_action"]
+                raffle_data.pop("on_end_action", None)
                 return await ctx.send(_("On end action reset to the default: `keep_winner`."))
 
             elif on_end_action is True:
@@ -266,7 +257,7 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
                 raffle_data["on_end_action"] = on_end_action
                 await ctx.send(_("On end action updated for this raffle."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def maxentries(
@@ -283,10 +274,11 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
 
             if not maximum_entries:
-                with contextlib.suppress(KeyError):
-                    del raffle_data["maximum_entries"]
+                raffle_data.pop("maximum_entries", None)
                 return await ctx.send(_("Maximum entries condition removed from this raffle."))
 
             elif maximum_entries is True:
@@ -298,7 +290,7 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
                 raffle_data["maximum_entries"] = maximum_entries
                 await ctx.send(_("Max entries requirement updated for this raffle."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def endmessage(
@@ -316,77 +308,62 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
             - `<raffle>` - The name of the raffle.
             - `<end_message>` - The new ending message.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
+        raffles = self.config.guild(ctx.guild).raffles
 
-            raffle_data = r.get(raffle, None)
+        if not end_message:
+            await raffles.clear_raw(raffle, "end_message")
+            return await ctx.send(
+                _("End message feature removed from this raffle. It will now use the default.")
+            )
 
-            if not end_message:
-                with contextlib.suppress(KeyError):
-                    del raffle_data["end_message"]
-                return await ctx.send(
-                    _("End message feature removed from this raffle. It will now use the default.")
-                )
+        elif end_message is True:
+            return await ctx.send(
+                _('Please provide a number, or "false" to disable this condition.')
+            )
 
-            elif end_message is True:
-                return await ctx.send(
-                    _('Please provide a number, or "false" to disable this condition.')
-                )
+        else:
+            try:
+                raffle_safe_member_scanner(end_message, "end_message")
+            except InvalidArgument as e:
+                return await ctx.send(format_traceback(e))
 
-            else:
-                try:
-                    raffle_safe_member_scanner(end_message, "end_message")
-                except InvalidArgument as e:
-                    return await ctx.send(format_traceback(e))
+            message = _(
+                "Would you like to add additional end messages to be selected from at random?"
+            )
 
-                message = _(
-                    "Would you like to add additional end messages to be selected from at random?"
+            message, confirmed = await yes_or_no_prompt(ctx, message)
+            if confirmed is None:
+                await ctx.send(
+                    _('You took too long to respond. Saving end message as "{}".').format(
+                        end_message
+                    )
                 )
 
-                can_react = ctx.channel.permissions_for(ctx.me).add_reactions
-                if not can_react:
-                    message += " (y/n)"
-                message = await ctx.send(message)
-                if can_react:
-                    start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
-                    predicate = ReactionPredicate.yes_or_no(message, ctx.author)
-                    event_type = "reaction_add"
-                else:
-                    predicate = MessagePredicate.yes_or_no(ctx)
-                    event_type = "message"
-
-                try:
-                    await self.bot.wait_for(event_type, check=predicate, timeout=30)
-                except asyncio.TimeoutError:
+            if confirmed:
+                interaction = await start_interactive_message_session(
+                    ctx, self.bot, "end_message", message
+                )
+                if interaction is False:
+                    data = end_message
                     await ctx.send(
-                        _(
-                            'You took too long to respond. Saving end message as "{}".'.format(
-                                end_message
-                            )
+                        _("End message set to what you provided previously: {}").format(
+                            end_message
                         )
                     )
-
-                if predicate.result:
-                    interaction = await start_interactive_message_session(
-                        ctx, self.bot, "end_message", message
-                    )
-                    if interaction is False:
-                        data = end_message
-                        await ctx.send(
-                            _(
-                                "End message set to what you provided previously: {}".format(
-                                    end_message
-                                )
-                            )
-                        )
-                    else:
-                        data = [end_message] + interaction
-                        await ctx.send(_("End messages updated for this raffle."))
                 else:
-                    data = end_message
-                    await ctx.send(_("End message updated for this raffle."))
+                    data = [end_message] + interaction
+                    await ctx.send(_("End messages updated for this raffle."))
+            else:
+                data = end_message
+                await ctx.send(_("End message updated for this raffle."))
+            async with raffles() as r:
+                raffle_data = r.get(raffle, None)
+                if raffle_data is None:
+                    # Ended while we were waiting on the author
+                    return await report_missing_raffle(ctx, raffle)
                 raffle_data["end_message"] = data
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def joinmessage(
@@ -404,79 +381,62 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
             - `<raffle>` - The name of the raffle.
             - `<join_message>` - The new joining message.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
+        raffles = self.config.guild(ctx.guild).raffles
 
-            raffle_data = r.get(raffle, None)
+        if not join_message:
+            await raffles.clear_raw(raffle, "join_message")
+            return await ctx.send(
+                _("Join message feature removed from this raffle. It will now use the default.")
+            )
 
-            if not join_message:
-                with contextlib.suppress(KeyError):
-                    del raffle_data["join_message"]
-                return await ctx.send(
-                    _(
-                        "Join message feature removed from this raffle. It will now use the default."
-                    )
-                )
+        elif join_message is True:
+            return await ctx.send(
+                _('Please provide a number, or "false" to disable this condition.')
+            )
 
-            elif join_message is True:
-                return await ctx.send(
-                    _('Please provide a number, or "false" to disable this condition.')
-                )
+        else:
+            try:
+                raffle_safe_member_scanner(join_message, "join_message")
+            except InvalidArgument as e:
+                return await ctx.send(format_traceback(e))
 
-            else:
-                try:
-                    raffle_safe_member_scanner(join_message, "join_message")
-                except InvalidArgument as e:
-                    return await ctx.send(format_traceback(e))
+            message = _(
+                "Would you like to add additional end messages to be selected from at random?"
+            )
 
-                message = _(
-                    "Would you like to add additional end messages to be selected from at random?"
+            message, confirmed = await yes_or_no_prompt(ctx, message)
+            if confirmed is None:
+                await ctx.send(
+                    _('You took too long to respond. Saving join message as "{}".').format(
+                        join_message
+                    )
                 )
 
-                can_react = ctx.channel.permissions_for(ctx.me).add_reactions
-                if not can_react:
-                    message += " (y/n)"
-                message = await ctx.send(message)
-                if can_react:
-                    start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
-                    predicate = ReactionPredicate.yes_or_no(message, ctx.author)
-                    event_type = "reaction_add"
-                else:
-                    predicate = MessagePredicate.yes_or_no(ctx)
-                    event_type = "message"
-
-                try:
-                    await self.bot.wait_for(event_type, check=predicate, timeout=30)
-                except asyncio.TimeoutError:
+            if confirmed:
+                interaction = await start_interactive_message_session(
+                    ctx, self.bot, "join_message", message
+                )
+                if interaction is False:
+                    data = join_message
                     await ctx.send(
-                        _(
-                            'You took too long to respond. Saving join message as "{}".'.format(
-                                join_message
-                            )
+                        _("Join message set to what you provided previously: {}").format(
+                            join_message
                         )
                     )
-
-                if predicate.result:
-                    interaction = await start_interactive_message_session(
-                        ctx, self.bot, "join_message", message
-                    )
-                    if interaction is False:
-                        data = join_message
-                        await ctx.send(
-                            _(
-                                "Join message set to what you provided previously: {}".format(
-                                    join_message
-                                )
-                            )
-                        )
-                    else:
-                        data = [join_message] + interaction
-                        await ctx.send(_("Join messages updated for this raffle."))
                 else:
-                    data = join_message
-                    await ctx.send(_("Join message updated for this raffle."))
+                    data = [join_message] + interaction
+                    await ctx.send(_("Join messages updated for this raffle."))
+            else:
+                data = join_message
+                await ctx.send(_("Join message updated for this raffle."))
+            async with raffles() as r:
+                raffle_data = r.get(raffle, None)
+                if raffle_data is None:
+                    # Ended while we were waiting on the author
+                    return await report_missing_raffle(ctx, raffle)
                 raffle_data["join_message"] = data
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @edit.command()
     async def fromyaml(self, ctx, raffle: RaffleFactoryConverter):
@@ -485,24 +445,13 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         **Arguments:**
             - `<raffle>` - The name of the raffle to edit.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffle_data = await fetch_raffle_or_report(
+            ctx, self.config.guild(ctx.guild).raffles, raffle
+        )
+        if raffle_data is None:
+            return
 
-        existing_data = {
-            "end_message": raffle_data.get("end_message", None),
-            "join_message": raffle_data.get("join_message", None),
-            "account_age": raffle_data.get("account_age", None),
-            "server_join_age": raffle_data.get("server_join_age", None),
-            "roles_needed_to_enter": raffle_data.get("roles_needed_to_enter", None),
-            "badges_needed_to_enter": raffle_data.get("badges_needed_to_enter", None),
-            "prevented_users": raffle_data.get("prevented_users", None),
-            "allowed_users": raffle_data.get("allowed_users", None),
-            "description": raffle_data.get("description", None),
-            "maximum_entries": raffle_data.get("maximum_entries", None),
-            "on_end_action": raffle_data.get("on_end_action", None),
-            "suspense_timer": raffle_data.get("suspense_timer", None),
-        }
+        existing_data = get_raffle_conditions(raffle_data)
 
         message = (
             _(
@@ -511,22 +460,18 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
                 "if you create a new raffle with the new name instead.\nYou can end "
                 "this raffle through using `{prefix}raffle end {raffle}`."
                 "\nPlease consider reading the docs about the various "
-                "conditional blocks if you haven't already.\n\n".format(
-                    prefix=ctx.clean_prefix, raffle=raffle
-                )
-            )
+                "conditional blocks if you haven't already.\n\n"
+            ).format(prefix=ctx.clean_prefix, raffle=raffle)
             + self.docs
         )
 
-        quotes = lambda x: f'"{x}"'
-        noedits = lambda x: _("{x} # Cannot be edited".format(x=x))
-        relevant_data = [("name", noedits(quotes(raffle)))]
+        relevant_data = [("name", _("{x} # Cannot be edited").format(x=quote(raffle)))]
         for k, v in raffle_data.items():
             if k in ("owner", "entries", "created_at"):
                 # These are not user defined keys
                 continue
             if isinstance(v, str):
-                v = quotes(v)
+                v = quote(v)
             relevant_data.append((k, v))
 
         message += _(
@@ -535,10 +480,10 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         )
         await ctx.send(message)
 
-        check = lambda x: x.channel == ctx.channel and x.author == ctx.author
-
         try:
-            content = await self.bot.wait_for("message", timeout=500, check=check)
+            content = await self.bot.wait_for(
+                "message", timeout=500, check=MessagePredicate.same_context(ctx)
+            )
         except asyncio.TimeoutError:
             with contextlib.suppress(discord.NotFound):
                 await message.delete()
@@ -549,10 +494,8 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         if not valid:
             return await ctx.send(
                 _(
-                    "Please provide valid YAML. You can validate your raffle YAML using `{}raffle parse`.".format(
-                        ctx.clean_prefix
-                    )
-                )
+                    "Please provide valid YAML. You can validate your raffle YAML using `{}raffle parse`."
+                ).format(ctx.clean_prefix)
             )
 
         valid["name"] = raffle
@@ -572,26 +515,16 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
         if raffle_data.get("created_at", None):
             data["created_at"] = raffle_data["created_at"]
 
-        conditions = {
-            "end_message": valid.get("end_message", None),
-            "join_message": valid.get("join_message", None),
-            "account_age": valid.get("account_age", None),
-            "server_join_age": valid.get("server_join_age", None),
-            "roles_needed_to_enter": valid.get("roles_needed_to_enter", None),
-            "badges_needed_to_enter": valid.get("badges_needed_to_enter", None),
-            "prevented_users": valid.get("prevented_users", None),
-            "allowed_users": valid.get("allowed_users", None),
-            "description": valid.get("description", None),
-            "maximum_entries": valid.get("maximum_entries", None),
-            "on_end_action": valid.get("on_end_action", None),
-            "suspense_timer": valid.get("suspense_timer", None),
-        }
+        conditions = get_raffle_conditions(valid)
 
         for k, v in conditions.items():
             if v:
                 data[k] = v
 
         async with self.config.guild(ctx.guild).raffles() as r:
+            if raffle not in r:
+                # Ended while we were waiting on the author
+                return await report_missing_raffle(ctx, raffle)
             r[raffle] = data
 
         additions = []
@@ -619,11 +552,11 @@ class EditorCommands(RaffleMixin, metaclass=MetaClass):
                 message += _("\n\nRemoved:\n") + "\n".join(f"- {d}" for d in deletions)
 
             diffs = box(message, lang="diff")
-            update = tick(_("Raffle edited. {}".format(diffs)))
+            update = tick(_("Raffle edited. {}").format(diffs))
 
         else:
             update = tick(_("No changes were made."))
 
         await ctx.send(update)
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
@@ -1,14 +1,13 @@
-import asyncio
+from typing import Union
 
 import discord
 from redbot.core import commands
 from redbot.core.i18n import Translator
-from redbot.core.utils.menus import start_adding_reactions
-from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 
 from ...mixins.abc import RaffleMixin
 from ...mixins.metaclass import MetaClass
-from ...utils.converters import RaffleFactoryConverter
+from ...utils.converters import RaffleFactoryConverter, fetch_raffle_or_report
+from ...utils.helpers import yes_or_no_prompt
 
 _ = Translator("Raffle", __file__)
 
@@ -38,51 +37,61 @@ class Prevented(RaffleMixin, metaclass=MetaClass):
             - `<raffle>` - The name of the raffle.
             - `<member>` - The member to add to the prevented list.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffles = self.config.guild(ctx.guild).raffles
+        async with raffles.get_lock():
+            raffle_data = await fetch_raffle_or_report(ctx, raffles, raffle)
+            if raffle_data is None:
+                return
 
             prevented = raffle_data.get("prevented_users", [])
 
             if member.id in prevented:
                 return await ctx.send(_("This user is already prevented in this raffle."))
 
-            if not prevented:
-                raffle_data["prevented_users"] = [member.id]
-            else:
-                prevented.append(member.id)
+            prevented.append(member.id)
+            await raffles.set_raw(raffle, "prevented_users", value=prevented)
 
-            await ctx.send(
-                _("{} added to the prevented list for this raffle.".format(member.name))
-            )
+        await ctx.send(_("{} added to the prevented list for this raffle.").format(member.name))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @prevented.command(name="remove", aliases=["del"])
-    async def prevented_remove(self, ctx, raffle: RaffleFactoryConverter, member: discord.Member):
+    async def prevented_remove(
+        self, ctx, raffle: RaffleFactoryConverter, member: Union[discord.Member, int]
+    ):
         """Remove a member from the prevented list of a raffle.
 
+        Users who have left the guild can be removed by their ID.
+
         **Arguments:**
             - `<raffle>` - The name of the raffle.
-            - `<member>` - The member to remove from the prevented list.
+            - `<member>` - The member, or user ID, to remove from the prevented list.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffles = self.config.guild(ctx.guild).raffles
+        async with raffles.get_lock():
+            raffle_data = await fetch_raffle_or_report(ctx, raffles, raffle)
+            if raffle_data is None:
+                return
 
             prevented = raffle_data.get("prevented_users", [])
 
-            if member.id not in prevented:
+            try:
+                prevented.remove(getattr(member, "id", member))
+            except ValueError:
                 return await ctx.send(_("This user was not already prevented in this raffle."))
 
-            prevented.remove(member.id)
-            if not prevented:
-                del raffle_data["prevented_users"]
-            await ctx.send(
-                _("{} remove from the prevented list for this raffle.".format(member.name))
+            if prevented:
+                await raffles.set_raw(raffle, "prevented_users", value=prevented)
+            else:
+                await raffles.clear_raw(raffle, "prevented_users")
+
+        await ctx.send(
+            _("{} remove from the prevented list for this raffle.").format(
+                getattr(member, "name", member)
             )
+        )
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @prevented.command(name="clear")
     async def prevented_clear(self, ctx, raffle: RaffleFactoryConverter):
@@ -91,41 +100,25 @@ class Prevented(RaffleMixin, metaclass=MetaClass):
         **Arguments:**
             - `<raffle>` - The name of the raffle.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
-
-            prevented = raffle_data.get("prevented_users", None)
+        raffles = self.config.guild(ctx.guild).raffles
+        prevented = await raffles.get_raw(raffle, "prevented_users", default=None)
 
-            if prevented is None:
-                return await ctx.send(_("There are no prevented users."))
+        if prevented is None:
+            return await ctx.send(_("There are no prevented users."))
 
-            message = _("Are you sure you want to clear the prevented users list for this raffle?")
-            can_react = ctx.channel.permissions_for(ctx.me).add_reactions
-            if not can_react:
-                message += " (yes/no)"
-            message = await ctx.send(message)
-            if can_react:
-                start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
-                predicate = ReactionPredicate.yes_or_no(message, ctx.author)
-                event_type = "reaction_add"
-            else:
-                predicate = MessagePredicate.yes_or_no(ctx)
-                event_type = "message"
+        message = _("Are you sure you want to clear the prevented users list for this raffle?")
+        message, confirmed = await yes_or_no_prompt(ctx, message)
+        if confirmed is None:
+            await ctx.send(_("You took too long to respond."))
+            return
 
+        if confirmed:
+            await raffles.clear_raw(raffle, "prevented_users")
+            msg = _("Prevented users list cleared for this raffle.")
             try:
-                await self.bot.wait_for(event_type, check=predicate, timeout=30)
-            except asyncio.TimeoutError:
-                await ctx.send(_("You took too long to respond."))
-                return
+                await message.edit(content=msg)
+            except discord.NotFound:
+                await ctx.send(msg)
 
-            if predicate.result:
-                del raffle_data["prevented_users"]
-                msg = _("Prevented users list cleared for this raffle.")
-                try:
-                    await message.edit(content=msg)
-                except discord.NotFound:
-                    await ctx.send(msg)
-
-            else:
-                await ctx.send(_("No changes have been made."))
+        else:
+            await ctx.send(_("No changes have been made."))
@@ -1,15 +1,11 @@
-import asyncio
-import contextlib
-
 import discord
 from redbot.core import commands
 from redbot.core.i18n import Translator
-from redbot.core.utils.menus import start_adding_reactions
-from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 
 from ...mixins.abc import RaffleMixin
 from ...mixins.metaclass import MetaClass
-from ...utils.converters import RaffleFactoryConverter
+from ...utils.converters import RaffleFactoryConverter, fetch_raffle_or_report
+from ...utils.helpers import yes_or_no_prompt
 
 _ = Translator("Raffle", __file__)
 
@@ -39,25 +35,25 @@ class RoleRequirements(RaffleMixin, metaclass=MetaClass):
             - `<raffle>` - The name of the raffle.
             - `<role>` - The role to add to the list of role requirements.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffles = self.config.guild(ctx.guild).raffles
+        async with raffles.get_lock():
+            raffle_data = await fetch_raffle_or_report(ctx, raffles, raffle)
+            if raffle_data is None:
+                return
 
             roles = raffle_data.get("roles_needed_to_enter", [])
 
             if role.id in roles:
                 return await ctx.send(_("This role is already a requirement in this raffle."))
 
-            if not roles:
-                raffle_data["roles_needed_to_enter"] = [role.id]
-            else:
-                roles.append(role.id)
+            roles.append(role.id)
+            await raffles.set_raw(raffle, "roles_needed_to_enter", value=roles)
 
-            await ctx.send(
-                _("{} added to the role requirement list for this raffle.".format(role.name))
-            )
+        await ctx.send(
+            _("{} added to the role requirement list for this raffle.").format(role.name)
+        )
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @rolesreq.command(name="remove", aliases=["del"])
     async def rolereq_remove(self, ctx, raffle: RaffleFactoryConverter, role: discord.Role):
@@ -67,21 +63,29 @@ class RoleRequirements(RaffleMixin, metaclass=MetaClass):
             - `<raffle>` - The name of the raffle.
             - `<role>` - The role to remove from the list of role requirements.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffles = self.config.guild(ctx.guild).raffles
+        async with raffles.get_lock():
+            raffle_data = await fetch_raffle_or_report(ctx, raffles, raffle)
+            if raffle_data is None:
+                return
 
             roles = raffle_data.get("roles_needed_to_enter", [])
 
-            if role.id not in roles:
+            try:
+                roles.remove(role.id)
+            except ValueError:
                 return await ctx.send(_("This role is not already a requirement in this raffle."))
 
-            roles.remove(role.id)
-            await ctx.send(
-                _("{} remove from the role requirement list for this raffle.".format(role.name))
-            )
+            if roles:
+                await raffles.set_raw(raffle, "roles_needed_to_enter", value=roles)
+            else:
+                await raffles.clear_raw(raffle, "roles_needed_to_enter")
+
+        await ctx.send(
+            _("{} remove from the role requirement list for this raffle.").format(role.name)
+        )
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @rolesreq.command(name="clear")
     async def rolereq_clear(self, ctx, raffle: RaffleFactoryConverter):
@@ -91,47 +95,26 @@ class RoleRequirements(RaffleMixin, metaclass=MetaClass):
         **Arguments:**
             - `<raffle>` - The name of the raffle.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
-
-            rolesreq = raffle_data.get("roles_needed_to_enter", [])
-
-            if rolesreq is None:
-                return await ctx.send(_("There are no required roles."))
-
-            message = _(
-                "Are you sure you want to clear the role requirement list for this raffle?"
-            )
-            can_react = ctx.channel.permissions_for(ctx.me).add_reactions
-            if not can_react:
-                message += " (yes/no)"
-            message = await ctx.send(message)
-            if can_react:
-                start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
-                predicate = ReactionPredicate.yes_or_no(message, ctx.author)
-                event_type = "reaction_add"
-            else:
-                predicate = MessagePredicate.yes_or_no(ctx)
-                event_type = "message"
+        raffles = self.config.guild(ctx.guild).raffles
+        rolesreq = await raffles.get_raw(raffle, "roles_needed_to_enter", default=None)
 
-            try:
-                await self.bot.wait_for(event_type, check=predicate, timeout=30)
-            except asyncio.TimeoutError:
-                await ctx.send(_("You took too long to respond."))
-                return
+        if rolesreq is None:
+            return await ctx.send(_("There are no required roles."))
 
-            if predicate.result:
-                with contextlib.suppress(KeyError):
-                    # Still wanna remove empty list here
-                    del raffle_data["roles_needed_to_enter"]
-                msg = "Role requirement list cleared for this raffle."
-                try:
-                    await message.edit(content=msg)
-                except discord.NotFound:
-                    await ctx.send(msg)
+        message = _("Are you sure you want to clear the role requirement list for this raffle?")
+        message, confirmed = await yes_or_no_prompt(ctx, message)
+        if confirmed is None:
+            await ctx.send(_("You took too long to respond."))
+            return
 
-            else:
-                await ctx.send(_("No changes have been made."))
+        if confirmed:
+            await raffles.clear_raw(raffle, "roles_needed_to_enter")
+            msg = "Role requirement list cleared for this raffle."
+            try:
+                await message.edit(content=msg)
+            except discord.NotFound:
+                await ctx.send(msg)
+            self.schedule_cleanup(ctx, raffle)
 
-            await self.clean_guild_raffles(ctx)
+        else:
+            await ctx.send(_("No changes have been made."))
@@ -1,17 +1,23 @@
 import asyncio
 import contextlib
 import random
+from typing import Union
 
 import discord
 from redbot.core import commands
 from redbot.core.commands import Context
 from redbot.core.i18n import Translator
-from redbot.core.utils.chat_formatting import humanize_list, pagify
+from redbot.core.utils.chat_formatting import pagify
 
 from ..mixins.abc import RaffleMixin
 from ..mixins.metaclass import MetaClass
 from ..utils.checks import account_age_checker, server_join_age_checker
-from ..utils.converters import RaffleExists, RaffleFactoryConverter
+from ..utils.converters import (
+    RaffleExists,
+    RaffleFactoryConverter,
+    fetch_raffle_or_report,
+    report_missing_raffle,
+)
 from ..utils.helpers import format_underscored_text, has_badge
 from ..utils.safety import RaffleSafeMember
 
@@ -35,68 +41,88 @@ class EventCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
-            raffle_entities = lambda x: raffle_data.get(x, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
+            entries = raffle_data.get("entries")
 
-            if not raffle_entities("entries"):
+            if not entries:
                 return await ctx.send(_("There are no participants yet for this raffle."))
 
-            winner = random.choice(raffle_entities("entries"))
+            # Users we can't see can't be announced as the winner. They may only be
+            # missing from the cache though, so leave pruning entries to the cleanup.
+            candidates = [i for i, u in enumerate(entries) if self.bot.get_user(u) is not None]
+            if not candidates:
+                return await ctx.send(_("None of the participants of this raffle could be found."))
 
-            message = raffle_entities("end_message")
+            winner_index = random.choice(candidates)
+            winner = entries[winner_index]
+
+            message = raffle_data.get("end_message", None)
             if message:
                 if isinstance(message, list):
                     message = random.choice(message)
             else:
                 message = _(r"Congratulations {winner.mention}, you have won the {raffle} raffle!")
 
-            on_end_action = raffle_entities("on_end_action") or "keep_winner"
+            on_end_action = raffle_data.get("on_end_action", None) or "keep_winner"
             message = message.format(
                 winner=RaffleSafeMember(self.bot.get_user(winner), "winner"), raffle=raffle
             )
 
-            # Let's add a bit of suspense, shall we? :P
-            await ctx.send(_("Picking a winner from the pool..."))
-            await ctx.trigger_typing()
-            await asyncio.sleep(raffle_data.get("suspense_timer", 2))
-
-            await ctx.send(message)
+            suspense_timer = raffle_data.get("suspense_timer", 2)
 
             if on_end_action == "remove_winner":
-                raffle_entities("entries").remove(winner)
+                del entries[winner_index]
             elif on_end_action == "keep_winner":
                 pass
             elif on_end_action == "remove_and_prevent_winner":
-                raffle_entities("entries").remove(winner)
-                if raffle_entities("prevented_users"):
-                    raffle_entities("prevented_users").append(winner)
+                del entries[winner_index]
+                prevented = raffle_data.get("prevented_users", None)
+                if prevented:
+                    if winner not in prevented:
+                        prevented.append(winner)
                 else:
                     raffle_data["prevented_users"] = [winner]
             else:
                 # end
                 r.pop(raffle)
 
-        await self.clean_guild_raffles(ctx)
+        # Let's add a bit of suspense, shall we? :P
+        await ctx.send(_("Picking a winner from the pool..."))
+        await ctx.trigger_typing()
+        await asyncio.sleep(suspense_timer)
+
+        await ctx.send(message)
+
+        self.schedule_cleanup(ctx, raffle)
 
     @raffle.command()
-    async def kick(self, ctx: Context, raffle: RaffleFactoryConverter, member: discord.Member):
+    async def kick(
+        self, ctx: Context, raffle: RaffleFactoryConverter, member: Union[discord.Member, int]
+    ):
         """Kick a member from your raffle.
 
+        Users who have left the guild can be kicked by their ID.
+
         **Arguments:**
             - `<raffle>` - The name of the raffle.
-            - `<member>` - The member to kick from the raffle.
+            - `<member>` - The member, or user ID, to kick from the raffle.
         """
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
-            raffle_entities = lambda x: raffle_data.get(x)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
+            entries = raffle_data.get("entries")
 
-            if member.id not in raffle_entities("entries"):
+            try:
+                entries.remove(getattr(member, "id", member))
+            except ValueError:
                 return await ctx.send(_("This user has not entered this raffle."))
 
-            raffle_entities("entries").remove(member.id)
             await ctx.send(_("User removed from the raffle."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @raffle.command()
     async def join(self, ctx: Context, raffle: RaffleExists):
@@ -105,97 +131,95 @@ class EventCommands(RaffleMixin, metaclass=MetaClass):
         **Arguments:**
             - `<raffle>` - The name of the raffle to join.
         """
-        r = await self.config.guild(ctx.guild).raffles()
-        raffle_data = r.get(raffle, None)
-
-        raffle_entities = lambda x: raffle_data.get(x, None)
-
-        if ctx.author.id in raffle_entities("entries"):
+        raffle_data = await fetch_raffle_or_report(
+            ctx, self.config.guild(ctx.guild).raffles, raffle
+        )
+        if raffle_data is None:
+            return
+
+        entries = raffle_data.get("entries")
+        prevented_users = raffle_data.get("prevented_users", None)
+        allowed_users = raffle_data.get("allowed_users", None)
+        maximum_entries = raffle_data.get("maximum_entries", None)
+        roles_needed_to_enter = raffle_data.get("roles_needed_to_enter", None)
+        account_age = raffle_data.get("account_age", None)
+        server_join_age = raffle_data.get("server_join_age", None)
+        badges_needed_to_enter = raffle_data.get("badges_needed_to_enter", None)
+
+        if ctx.author.id in entries:
             return await ctx.send(_("You are already in this raffle."))
 
-        if raffle_entities("prevented_users") and ctx.author.id in raffle_entities(
-            "prevented_users"
-        ):
+        if prevented_users and ctx.author.id in prevented_users:
             return await ctx.send(_("You are not allowed to join this particular raffle."))
 
-        if raffle_entities("allowed_users") and ctx.author.id not in raffle_entities(
-            "allowed_users"
-        ):
+        if allowed_users and ctx.author.id not in allowed_users:
             return await ctx.send(_("You are not allowed to join this particular raffle"))
 
-        if ctx.author.id == raffle_entities("owner"):
+        if ctx.author.id == raffle_data.get("owner", None):
             return await ctx.send(_("You cannot join your own raffle."))
 
-        if raffle_entities("maximum_entries") and len(
-            raffle_entities("entries")
-        ) > raffle_entities("maximum_entries"):
+        if maximum_entries and len(entries) > maximum_entries:
             return await ctx.send(
                 _("Sorry, the maximum number of users have entered this raffle.")
             )
 
-        if raffle_entities("roles_needed_to_enter"):
-            for r in raffle_entities("roles_needed_to_enter"):
-                if not r in [x.id for x in ctx.author.roles]:
+        if roles_needed_to_enter:
+            author_roles = {x.id for x in ctx.author.roles}
+            if not author_roles.issuperset(roles_needed_to_enter):
+                for r in roles_needed_to_enter:
+                    if r in author_roles:
+                        continue
+                    role = ctx.guild.get_role(r)
+                    if role is None:
+                        # Deleted roles can't be obtained, so they can't be required
+                        continue
                     return await ctx.send(
-                        _(
-                            "You are missing a required role: {}".format(
-                                ctx.guild.get_role(r).mention
-                            )
-                        )
+                        _("You are missing a required role: {}").format(role.mention)
                     )
 
-        if raffle_entities("account_age") and not account_age_checker(
-            raffle_entities("account_age")
-        ):
+        if account_age and not account_age_checker(account_age):
             return await ctx.send(
-                _(
-                    "Your account must be at least {} days old to join.".format(
-                        raffle_entities("account_age")
-                    )
-                )
+                _("Your account must be at least {} days old to join.").format(account_age)
             )
 
-        if raffle_entities("server_join_age") and not server_join_age_checker(
-            ctx, raffle_entities("server_join_age")
-        ):
+        if server_join_age and not server_join_age_checker(ctx, server_join_age):
             return await ctx.send(
-                _(
-                    "You must have been in this guild for at least {} days to join.".format(
-                        raffle_entities("server_join_age")
-                    )
+                _("You must have been in this guild for at least {} days to join.").format(
+                    server_join_age
                 )
             )
 
-        if raffle_entities("badges_needed_to_enter"):
-            for badge in raffle_entities("badges_needed_to_enter"):
+        if badges_needed_to_enter:
+            for badge in badges_needed_to_enter:
                 if not has_badge(badge, ctx.author):
                     return await ctx.send(
-                        _(
-                            'You must have the "{}" Discord badge to join.'.format(
-                                format_underscored_text(badge)
-                            )
+                        _('You must have the "{}" Discord badge to join.').format(
+                            format_underscored_text(badge)
                         )
                     )
 
         async with self.config.guild(ctx.guild).raffles() as r:
-            raffle_entities = lambda x: r[raffle].get(x, None)
-            raffle_entities("entries").append(ctx.author.id)
+            raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
+            entries = raffle_data["entries"]
+            entries.append(ctx.author.id)
 
-        welcome_msg = _("{} you have been added to the raffle.".format(ctx.author.mention))
+        welcome_msg = _("{} you have been added to the raffle.").format(ctx.author.mention)
 
-        join = raffle_entities("join_message")
+        join = raffle_data.get("join_message", None)
         if join:
             if isinstance(join, list):
                 join = random.choice(join)
             join_message = join.format(
                 user=RaffleSafeMember(ctx.author, "user"),
                 raffle=raffle,
-                entry_count=len(raffle_entities("entries")),
+                entry_count=len(entries),
             )
             welcome_msg += "\n---\n{}".format(join_message)
 
         await ctx.send(welcome_msg)
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @raffle.command()
     async def leave(self, ctx: Context, raffle: RaffleExists):
@@ -207,17 +231,20 @@ class EventCommands(RaffleMixin, metaclass=MetaClass):
         async with self.config.guild(ctx.guild).raffles() as r:
 
             raffle_data = r.get(raffle, None)
+            if raffle_data is None:
+                return await report_missing_raffle(ctx, raffle)
             raffle_entries = raffle_data.get("entries")
 
-            if not ctx.author.id in raffle_entries:
+            try:
+                raffle_entries.remove(ctx.author.id)
+            except ValueError:
                 return await ctx.send(_("You are not entered into this raffle."))
 
-            raffle_entries.remove(ctx.author.id)
             await ctx.send(
-                _("{0.mention} you have been removed from the raffle.".format(ctx.author))
+                _("{0.mention} you have been removed from the raffle.").format(ctx.author)
             )
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx, raffle)
 
     @raffle.command()
     async def mention(self, ctx: Context, raffle: RaffleFactoryConverter):
@@ -226,21 +253,22 @@ class EventCommands(RaffleMixin, metaclass=MetaClass):
         **Arguments:**
             - `<raffle>` - The name of the raffle to mention all the members in.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            raffle_data = r.get(raffle, None)
+        raffle_data = await fetch_raffle_or_report(
+            ctx, self.config.guild(ctx.guild).raffles, raffle
+        )
+        if raffle_data is None:
+            return
+        entries = raffle_data.get("entries")
 
-            raffle_entities = lambda x: raffle_data.get(x)
+        if not entries:
+            return await ctx.send(_("There are no entries yet for this raffle."))
 
-            if not raffle_entities("entries"):
-                return await ctx.send(_("There are no entries yet for this raffle."))
+        users = [u for u in map(self.bot.get_user, entries) if u is not None]
+        if not users:
+            return await ctx.send(_("None of the participants of this raffle could be found."))
 
-            for page in pagify(
-                humanize_list([self.bot.get_user(u).mention for u in raffle_entities("entries")])
-            ):
-                await ctx.send(page)
-
-        await self.clean_guild_raffles(ctx)
+        for page in pagify(" ".join(u.mention for u in users), delims=[" "]):
+            await ctx.send(page)
 
     @raffle.command()
     async def end(self, ctx: Context, raffle: RaffleFactoryConverter):
@@ -249,14 +277,13 @@ class EventCommands(RaffleMixin, metaclass=MetaClass):
         **Arguments:**
             - `<raffle>` - The name of the raffle to end.
         """
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            msg = await ctx.send(_("Ending the `{raffle}` raffle...".format(raffle=raffle)))
+        msg = await ctx.send(_("Ending the `{raffle}` raffle...").format(raffle=raffle))
 
+        async with self.config.guild(ctx.guild).raffles() as r:
             r.pop(raffle)
 
         await asyncio.sleep(1)
         with contextlib.suppress(discord.NotFound):
             await msg.edit(content=_("Raffle ended."))
 
-        await self.clean_guild_raffles(ctx)
+        self.schedule_cleanup(ctx)
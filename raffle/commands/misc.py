@@ -5,15 +5,14 @@ import discord
 from redbot.core import commands
 from redbot.core.commands import Context
 from redbot.core.i18n import Translator
-from redbot.core.utils.menus import start_adding_reactions
-from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
+from redbot.core.utils.predicates import MessagePredicate
 
 from ..mixins.abc import RaffleMixin
 from ..mixins.metaclass import MetaClass
 from ..utils.converters import RaffleFactoryConverter
 from ..utils.exceptions import RaffleError
 from ..utils.formatting import cross, tick
-from ..utils.helpers import cleanup_code, format_traceback, validator
+from ..utils.helpers import cleanup_code, format_traceback, validator, yes_or_no_prompt
 from ..utils.parser import RaffleManager
 
 _ = Translator("Raffle", __file__)
@@ -29,8 +28,6 @@ class MiscCommands(RaffleMixin, metaclass=MetaClass):
     @raffle.command()
     async def parse(self, ctx: Context):
         """Parse a complex raffle without actually creating it."""
-        await ctx.trigger_typing()
-        check = lambda x: x.author == ctx.author and x.channel == ctx.channel
         message = _(
             "Paste your YAML here. It will be validated, and if there is "
             "an exception, it will be returned to you."
@@ -39,7 +36,9 @@ class MiscCommands(RaffleMixin, metaclass=MetaClass):
         await ctx.send(message)
 
         try:
-            content = await self.bot.wait_for("message", timeout=500, check=check)
+            content = await self.bot.wait_for(
+                "message", timeout=500, check=MessagePredicate.same_context(ctx)
+            )
         except asyncio.TimeoutError:
             with contextlib.suppress(discord.NotFound):
                 await message.delete()
@@ -59,12 +58,10 @@ class MiscCommands(RaffleMixin, metaclass=MetaClass):
 
         await ctx.send(tick(_("This YAML is good to go! No errors were found.")))
 
-        await self.clean_guild_raffles(ctx)
-
     @raffle.group(invoke_without_command=True)
     async def refresh(self, ctx: Context, raffle: RaffleFactoryConverter):
         """Refresh raffle(s)."""
-        cleaner = await self.clean_singular_raffle(ctx, raffle)
+        cleaner = await self.clean_singular_raffle(ctx, raffle, force=True)
         if cleaner:
             return await ctx.send(_("Raffle updated."))
         else:
@@ -74,8 +71,7 @@ class MiscCommands(RaffleMixin, metaclass=MetaClass):
     @refresh.command(name="guild")
     async def refresh_guild(self, ctx: Context):
         """Refresh this guild's raffles."""
-        await ctx.trigger_typing()
-        cleaner = await self.clean_guild_raffles(ctx)
+        cleaner = await self.clean_guild_raffles(ctx, force=True)
         if cleaner:
             return await ctx.send(_("Raffles updated."))
         else:
@@ -100,33 +96,18 @@ class MiscCommands(RaffleMixin, metaclass=MetaClass):
             return
 
         message = _("Are you sure you want to tear down all ongoing raffles in this guild?")
-        can_react = ctx.channel.permissions_for(ctx.me).add_reactions
-        if not can_react:
-            message += " (y/n)"
-        message = await ctx.send(message)
-        if can_react:
-            start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
-            predicate = ReactionPredicate.yes_or_no(message, ctx.author)
-            event_type = "reaction_add"
-        else:
-            predicate = MessagePredicate.yes_or_no(ctx)
-            event_type = "message"
-
-        try:
-            await self.bot.wait_for(event_type, check=predicate, timeout=30)
-        except asyncio.TimeoutError:
+        message, confirmed = await yes_or_no_prompt(ctx, message)
+        if confirmed is None:
             await ctx.send(_("You took too long to respond."))
             return
 
         with contextlib.suppress(discord.NotFound):
             await message.delete()
 
-        if predicate.result:
+        if confirmed:
             async with self.config.guild(ctx.guild).raffles() as r:
                 r.clear()
             await ctx.send(_("Raffles cleared."))
 
         else:
             await ctx.send(_("No changes have been made."))
-
-        await self.clean_guild_raffles(ctx)
@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC
+from typing import Dict, Optional, Set, Tuple, Union
 
 from redbot.core import Config
 from redbot.core.bot import Red
@@ -11,3 +13,6 @@ class RaffleMixin(ABC):
     def __init__(self, *nargs):
         self.config: Config
         self.bot: Red
+        self.last_cleanups: Dict[Union[int, Tuple[int, str]], float]
+        self.cleanup_tasks: Dict[int, asyncio.Task]
+        self.pending_cleanups: Dict[int, Optional[Set[str]]]
@@ -41,6 +41,9 @@ class Raffle(*mixinargs, metaclass=MetaClass):
         self.bot = bot
         self.config = Config.get_conf(self, 583475034985340, force_registration=True)
         self.config.register_guild(raffles={})
+        self.last_cleanups = {}
+        self.cleanup_tasks = {}
+        self.pending_cleanups = {}
         self.docs = "https://kreusadacogs.readthedocs.io/en/latest/cog_raffle.html"
         if 719988449867989142 in self.bot.owner_ids:
             with contextlib.suppress(Exception):
@@ -49,16 +52,11 @@ class Raffle(*mixinargs, metaclass=MetaClass):
     def format_help_for_context(self, ctx: commands.Context) -> str:
         context = super().format_help_for_context(ctx)
         authors = humanize_list(self.__author__)
-        fmtlink = lambda x, y: f"[{x}]({y})"
-        docnote = _(
-            "Please consider reading the {docs} if you haven't already.\n\n".format(
-                docs=fmtlink("docs", self.docs)
-            )
+        docnote = _("Please consider reading the {docs} if you haven't already.\n\n").format(
+            docs=f"[docs]({self.docs})"
         )
-        return _(
-            "{context}\n\n{docnote}Author: {authors}\nVersion: {version}".format(
-                context=context, docnote=docnote, authors=authors, version=self.__version__
-            )
+        return _("{context}\n\n{docnote}Author: {authors}\nVersion: {version}").format(
+            context=context, docnote=docnote, authors=authors, version=self.__version__
         )
 
     async def red_delete_data_for_user(self, **kwargs):
@@ -68,6 +66,8 @@ class Raffle(*mixinargs, metaclass=MetaClass):
     def cog_unload(self):
         with contextlib.suppress(Exception):
             self.bot.remove_dev_env_value("raffle")
+        for task in self.cleanup_tasks.values():
+            task.cancel()
 
     async def cog_check(self, ctx: commands.Context):
         return ctx.guild is not None
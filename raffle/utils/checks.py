@@ -1,11 +1,21 @@
-account_age_checker = lambda x: x < (now - discord_creation_date).days
-server_join_age_checker = lambda ctx, x: x < (now - ctx.guild.created_at).days
-
 import datetime
 
-now = datetime.datetime.now()
 discord_creation_date = datetime.datetime(2015, 5, 13)
 
+
+def utcnow() -> datetime.datetime:
+    # Naive UTC, to match the naive UTC datetimes discord.py gives us
+    return datetime.datetime.utcnow()
+
+
+def account_age_checker(x: int) -> bool:
+    return x < (utcnow() - discord_creation_date).days
+
+
+def server_join_age_checker(ctx, x: int) -> bool:
+    return x < (utcnow() - ctx.guild.created_at).days
+
+
 VALID_USER_BADGES = [
     "bug_hunter",
     "bug_hunter_level_2",
@@ -1,59 +1,153 @@
+import asyncio
+import time
+from typing import Optional, Tuple, Union
+
+from discord import Guild
 from redbot.core.commands import Context
 
 from ..log import log
 from ..mixins.abc import RaffleMixin
 
+# Members and roles go stale at human timescales, so guild and raffle
+# cleanups don't need to run more often than this (in seconds)
+CLEANUP_COOLDOWN = 60
+
+# How long to wait before running a scheduled cleanup, so that a burst
+# of commands in one guild only triggers a single cleanup (in seconds)
+CLEANUP_DELAY = 1
+
 
 class CleanupHelpers(RaffleMixin):
     """Various utilities to prevent stale dictionary values"""
 
-    async def clean_raffles(self, ctx: Context) -> None:
+    @staticmethod
+    def clean_raffle_data(guild: Guild, raffle_data: dict) -> bool:
+        """Remove unknown and duplicate members and roles from a raffle, in place.
+
+        Returns whether anything was removed.
+        """
+        updated = False
+        for key, getter in (
+            ("entries", guild.get_member),
+            ("prevented_users", guild.get_member),
+            ("allowed_users", guild.get_member),
+            ("roles_needed_to_enter", guild.get_role),
+        ):
+            ids = raffle_data.get(key, None)
+            if not ids:
+                continue
+            seen = set()
+            kept = []
+            for i in ids:
+                if i not in seen and getter(i):
+                    kept.append(i)
+                seen.add(i)
+            if len(kept) != len(ids):
+                ids[:] = kept
+                updated = True
+        return updated
+
+    def _mark_cleaned(self, key: Union[int, Tuple[int, str]], now: float) -> None:
+        # Entries past the cooldown no longer throttle anything, and raffles
+        # can be removed without a cleanup ever seeing them go
+        self.last_cleanups = {
+            k: t for k, t in self.last_cleanups.items() if now - t < CLEANUP_COOLDOWN
+        }
+        self.last_cleanups[key] = now
+
+    async def clean_raffles(self, ctx: Context, *, force: bool = False) -> bool:
+        now = time.monotonic()
+        last = self.last_cleanups.get(ctx.guild.id, None)
+        if not force and last is not None and now - last < CLEANUP_COOLDOWN:
+            return False
+        self._mark_cleaned(ctx.guild.id, now)
+
         async with self.config.guild(ctx.guild).raffles() as r:
 
-            updates = {}
+            updated = False
 
             for k, v in list(r.items()):
 
-                getter = v.get("owner")
-                if not ctx.guild.get_member(getter):
+                if not ctx.guild.get_member(v.get("owner")):
                     del r[k]
-                    updates["owner"] = True
-
-                getter = v.get("entries")
-                for userid in getter:
-                    if not ctx.guild.get_member(userid):
-                        getter.remove(userid)
-                        updates["entries"] = True
-
-                getter = v.get("prevented_users", None)
-                if getter:
-                    for userid in getter:
-                        if not ctx.guild.get_member(userid):
-                            getter.remove(userid)
-                            updates["prevented_users"] = True
-
-                getter = v.get("allowed_users", None)
-                if getter:
-                    for userid in getter:
-                        if not ctx.guild.get_member(userid):
-                            getter.remove(userid)
-                            updates["allowed_users"] = True
-
-                getter = v.get("roles_needed_to_enter", None)
-                if getter:
-                    for roleid in getter:
-                        if not ctx.guild.get_role(roleid):
-                            getter.remove(roleid)
-                            updates["roles_needed_to_enter"] = True
-
-        return any(updates.values())
+                    updated = True
+                    continue
+
+                if self.clean_raffle_data(ctx.guild, v):
+                    updated = True
+
+        return updated
 
     @property
     def clean_guild_raffles(self):
         return self.clean_raffles
 
+    def schedule_cleanup(self, ctx: Context, raffle: Optional[str] = None) -> None:
+        """Clean this guild's raffles in the background.
+
+        If a raffle name is given, only that raffle is cleaned.
+        Calls made while a cleanup is already pending for
+        the guild are folded into that cleanup.
+        """
+        guild_id = ctx.guild.id
+        if guild_id in self.pending_cleanups:
+            names = self.pending_cleanups[guild_id]
+            if names is not None:
+                if raffle is None:
+                    self.pending_cleanups[guild_id] = None
+                else:
+                    names.add(raffle)
+            return
+        self.pending_cleanups[guild_id] = None if raffle is None else {raffle}
+        self.cleanup_tasks[guild_id] = asyncio.create_task(self._deferred_cleanup(ctx))
+
+    async def _deferred_cleanup(self, ctx: Context) -> None:
+        guild_id = ctx.guild.id
+        try:
+            await asyncio.sleep(CLEANUP_DELAY)
+            names = self.pending_cleanups.pop(guild_id)
+            if names is None:
+                await self.clean_raffles(ctx)
+            else:
+                for name in names:
+                    await self.clean_singular_raffle(ctx, name)
+        except Exception:
+            log.exception("Failed to clean up the raffles for guild %s", guild_id)
+        finally:
+            # A newer cleanup may have been scheduled once ours started running
+            if self.cleanup_tasks.get(guild_id) is asyncio.current_task():
+                del self.cleanup_tasks[guild_id]
+                self.pending_cleanups.pop(guild_id, None)
+
     async def initialize(self):
         all_guilds = await self.config.all_guilds()
+
+        # Raffle names are stored lowercase, so name lookups can be plain
+        # dict lookups. Older raffles may still have mixed case names.
+        for g, data in all_guilds.items():
+            raffles = data["raffles"]
+            if all(k == k.lower() for k in raffles.keys()):
+                continue
+            lowered = {}
+            # Place names that are already lowercase first, so they keep their names
+            for k, v in sorted(raffles.items(), key=lambda x: x[0] != x[0].lower()):
+                name = k.lower()
+                n = 1
+                while name in lowered:
+                    n += 1
+                    name = f"{k.lower()}_{n}"
+                if name != k.lower():
+                    log.warning(
+                        "Raffle %r in guild %s was renamed to %r, as %r is already taken",
+                        k,
+                        g,
+                        name,
+                        k.lower(),
+                    )
+                lowered[name] = v
+            data["raffles"] = lowered
+            await self.config.guild_from_id(g).raffles.set(lowered)
+
         changed_guilds = []
         for g in all_guilds.keys():
             gobj = self.bot.get_guild(g)
@@ -87,42 +181,35 @@ class CleanupHelpers(RaffleMixin):
                 % len(changed_guilds)
             )
 
-    async def clean_singular_raffle(self, ctx: Context, raffle: str) -> None:
-        async with self.config.guild(ctx.guild).raffles() as r:
-
-            updates = {}
-            raffle_data = r[raffle]
-
-            getter = raffle_data.get("owner")
-            if not ctx.guild.get_member(getter):
-                del r[raffle][getter]
-                updates["owner"] = True
-
-            getter = raffle_data.get("entries")
-            for userid in getter:
-                if not ctx.guild.get_member(userid):
-                    getter.remove(userid)
-                    updates["entries"] = True
-
-            getter = raffle_data.get("prevented_users", None)
-            if getter:
-                for userid in getter:
-                    if not ctx.guild.get_member(userid):
-                        getter.remove(userid)
-                        updates["prevented_users"] = True
-
-            getter = raffle_data.get("allowed_users", None)
-            if getter:
-                for userid in getter:
-                    if not ctx.guild.get_member(userid):
-                        getter.remove(userid)
-                        updates["allowed_users"] = True
-
-            getter = raffle_data.get("roles_needed_to_enter", None)
-            if getter:
-                for roleid in getter:
-                    if not ctx.guild.get_role(roleid):
-                        getter.remove(roleid)
-                        updates["roles_needed_to_enter"] = True
-
-        return any(updates.values())
+    async def clean_singular_raffle(
+        self, ctx: Context, raffle: str, *, force: bool = False
+    ) -> bool:
+        key = (ctx.guild.id, raffle)
+        now = time.monotonic()
+        if not force:
+            # A guild-wide pass covers this raffle too
+            for k in (ctx.guild.id, key):
+                last = self.last_cleanups.get(k, None)
+                if last is not None and now - last < CLEANUP_COOLDOWN:
+                    return False
+        self._mark_cleaned(key, now)
+
+        raffles = self.config.guild(ctx.guild).raffles
+        async with raffles.get_lock():
+
+            raffle_data = await raffles.get_raw(raffle, default=None)
+            if raffle_data is None:
+                # Ended before we got to it
+                self.last_cleanups.pop(key, None)
+                return False
+
+            if not ctx.guild.get_member(raffle_data.get("owner")):
+                await raffles.clear_raw(raffle)
+                self.last_cleanups.pop(key, None)
+                return True
+
+            if not self.clean_raffle_data(ctx.guild, raffle_data):
+                return False
+
+            await raffles.set_raw(raffle, value=raffle_data)
+            return True
@@ -1,10 +1,43 @@
+from typing import Optional
+
 from redbot.core.commands import BadArgument, Context, Converter
+from redbot.core.config import Group
+from redbot.core.i18n import Translator
 
 __all__ = (
     "RaffleFactoryConverter",
     "RaffleExists",
 )
 
+_ = Translator("Raffle", __file__)
+
+
+def _no_raffle_message(name: str) -> str:
+    return _("There is not an ongoing raffle with the name `{}`.").format(name)
+
+
+async def _get_raffle(ctx: Context, name: str) -> dict:
+    raffle_data = await ctx.cog.config.guild(ctx.guild).raffles.get_raw(name, default=None)
+    if raffle_data is None:
+        raise BadArgument(_no_raffle_message(name))
+    return raffle_data
+
+
+async def report_missing_raffle(ctx: Context, name: str) -> None:
+    """Tell the author that a raffle doesn't exist.
+
+    For raffles which were ended after their converter checked them.
+    """
+    await ctx.send(_no_raffle_message(name))
+
+
+async def fetch_raffle_or_report(ctx: Context, raffles: Group, name: str) -> Optional[dict]:
+    """Get the data of a raffle, or report it missing and return None."""
+    raffle_data = await raffles.get_raw(name, default=None)
+    if raffle_data is None:
+        await report_missing_raffle(ctx, name)
+    return raffle_data
+
 
 class RaffleFactoryConverter(Converter):
     """A checker which raises BadArgument if the
@@ -12,13 +45,9 @@ class RaffleFactoryConverter(Converter):
     of the guild, or if the raffle doesn't exist."""
 
     async def convert(self, ctx: Context, argument: str):
-        async with ctx.cog.config.guild(ctx.guild).raffles() as raffles:
-            if not argument in raffles.keys():
-                raise BadArgument(
-                    "There is not an ongoing raffle with the name `{}`.".format(argument)
-                )
-            if ctx.author.id not in (raffles[argument]["owner"], ctx.guild.owner_id):
-                raise BadArgument("You are not the owner of this raffle.")
+        raffle_data = await _get_raffle(ctx, argument)
+        if ctx.author.id not in (raffle_data["owner"], ctx.guild.owner_id):
+            raise BadArgument("You are not the owner of this raffle.")
         return argument
 
 
@@ -27,11 +56,7 @@ class RaffleExists(Converter):
     if the raffle doesn't exist."""
 
     async def convert(self, ctx: Context, argument: str):
-        async with ctx.cog.config.guild(ctx.guild).raffles() as raffles:
-            if not argument in raffles.keys():
-                raise BadArgument(
-                    "There is not an ongoing raffle with the name `{}`.".format(argument)
-                )
+        await _get_raffle(ctx, argument)
         return argument
 
 
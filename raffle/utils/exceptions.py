@@ -32,7 +32,7 @@ class RequiredKeyError(RaffleError):
         self.key = key
 
     def __str__(self):
-        return _('({0.key}) The "{0.key}" key is required'.format(self))
+        return _('({0.key}) The "{0.key}" key is required').format(self)
 
 
 class UnknownEntityError(RaffleError):
@@ -43,7 +43,7 @@ class UnknownEntityError(RaffleError):
         self.type = _type
 
     def __str__(self):
-        return _('"{0.data}" was not a valid {0.type}'.format(self))
+        return _('"{0.data}" was not a valid {0.type}').format(self)
 
 
 class RaffleSyntaxError(RaffleError):
@@ -18,6 +18,10 @@ def square(text):
     return "[{}]".format(text)
 
 
+def quote(text):
+    return '"{}"'.format(text)
+
+
 RIGHT_ARROW = "\N{BLACK RIGHTWARDS ARROW}\N{VARIATION SELECTOR-16}"
 LEFT_ARROW = "\N{LEFTWARDS BLACK ARROW}\N{VARIATION SELECTOR-16}"
 CURRENT_PAGE = "\N{BLACK CIRCLE FOR RECORD}\N{VARIATION SELECTOR-16}"
@@ -1,5 +1,6 @@
 import asyncio
-from typing import List, Literal, Union
+import datetime
+from typing import List, Literal, Optional, Tuple, Union
 
 import discord
 import yaml
@@ -7,10 +8,9 @@ from redbot.core.bot import Red as RedBot
 from redbot.core.commands import Context
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box
-from redbot.core.utils.menus import DEFAULT_CONTROLS, close_menu, menu
-from yaml.parser import MarkedYAMLError
+from redbot.core.utils.menus import DEFAULT_CONTROLS, close_menu, menu, start_adding_reactions
+from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 
-from .checks import now
 from .enums import RaffleEndMessageComponents, RaffleJoinMessageComponents
 from .exceptions import InvalidArgument, RaffleError
 from .formatting import cross, curl, formatenum
@@ -18,13 +18,41 @@ from .safety import RaffleSafeMember
 
 _ = Translator("Raffle", __file__)
 
+# Prefer the libyaml bindings when PyYAML was built with them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# User defined conditions, everything apart from the name
+RAFFLE_CONDITIONS = (
+    "end_message",
+    "join_message",
+    "account_age",
+    "server_join_age",
+    "roles_needed_to_enter",
+    "badges_needed_to_enter",
+    "prevented_users",
+    "allowed_users",
+    "description",
+    "maximum_entries",
+    "on_end_action",
+    "suspense_timer",
+)
+
 
 listumerate = lambda *args: list(enumerate(*args))
 
 
+def get_raffle_conditions(data: dict) -> dict:
+    conditions = {k: data.get(k, None) for k in RAFFLE_CONDITIONS}
+    for k in ("roles_needed_to_enter", "prevented_users", "allowed_users"):
+        if isinstance(conditions[k], list):
+            # These are sets of IDs, drop repeats but keep the given order
+            conditions[k] = list(dict.fromkeys(conditions[k]))
+    return conditions
+
+
 def format_traceback(exc) -> str:
-    boxit = lambda x, y: box(f"{x}: {y}", lang="yaml")
-    return boxit(exc.__class__.__name__, exc)
+    return box(f"{exc.__class__.__name__}: {exc}", lang="yaml")
 
 
 def cleanup_code(content) -> str:
@@ -35,9 +63,12 @@ def cleanup_code(content) -> str:
 
 
 def validator(data) -> Union[bool, dict]:
+    if ":" not in data:
+        # A mapping needs at least one "key: value" pair, don't bother parsing
+        return False
     try:
-        loader = yaml.full_load(data)
-    except MarkedYAMLError:
+        loader = yaml.load(data, Loader=YAML_LOADER)
+    except yaml.MarkedYAMLError:
         return False
     if not isinstance(loader, dict):
         return False
@@ -45,7 +76,7 @@ def validator(data) -> Union[bool, dict]:
 
 
 def getstrftime(perc: str) -> Union[str, int]:
-    return now.strftime(f"%{perc}")
+    return datetime.datetime.now().strftime(f"%{perc}")
 
 
 def number_suffix(number: int) -> str:
@@ -106,6 +137,36 @@ def raffle_safe_member_scanner(content: str, cond: Literal["join_message", "end_
         )
 
 
+async def yes_or_no_prompt(
+    ctx: Context, content: str, *, timeout: int = 30
+) -> Tuple[discord.Message, Optional[bool]]:
+    """Ask the author a yes or no question.
+
+    Reactions are used when the bot can add them, otherwise
+    the author has to reply with yes or no.
+
+    Returns the prompt message and the answer, which is None
+    if the author didn't respond in time.
+    """
+    can_react = ctx.channel.permissions_for(ctx.me).add_reactions
+    if not can_react:
+        content += " (y/n)"
+    message = await ctx.send(content)
+    if can_react:
+        start_adding_reactions(message, ReactionPredicate.YES_OR_NO_EMOJIS)
+        predicate = ReactionPredicate.yes_or_no(message, ctx.author)
+        event_type = "reaction_add"
+    else:
+        predicate = MessagePredicate.yes_or_no(ctx)
+        event_type = "message"
+
+    try:
+        await ctx.bot.wait_for(event_type, check=predicate, timeout=timeout)
+    except asyncio.TimeoutError:
+        return message, None
+    return message, predicate.result
+
+
 async def start_interactive_message_session(
     ctx: Context,
     bot: RedBot,
@@ -122,15 +183,15 @@ async def start_interactive_message_session(
     guide = _(
         "Start adding some messages to add to the list of {sesstype} messages.\n"
         "{when_phrase}, one of these messages will be randomly selected.\n\n"
-        "**Available variables:**".format(sesstype=sesstype.split("_")[0], when_phrase=when_phrase)
-    )
+        "**Available variables:**"
+    ).format(sesstype=sesstype.split("_")[0], when_phrase=when_phrase)
 
-    b = lambda x: box(x, lang="yaml")
-    guide += b(
+    guide += box(
         "\n".join(
             f"{curl(formatenum(u.name))}: {u.value}"
             for u in sorted(ENUM, key=lambda x: len(x.name))
-        )
+        ),
+        lang="yaml",
     )
     try:
         await message.edit(content=guide)
@@ -140,22 +201,18 @@ async def start_interactive_message_session(
 
     messages = []
 
-    check = lambda x: x.channel == ctx.channel and x.author == ctx.author
+    check = MessagePredicate.same_context(ctx)
     tostop = lambda x: f"{x}\n> " + _(
-        "Type {stop} or {exit} to discontinue gathering messages.".format(
-            stop="**stop()**", exit="**exit()**"
-        )
-    )
+        "Type {stop} or {exit} to discontinue gathering messages."
+    ).format(stop="**stop()**", exit="**exit()**")
     bubble = lambda x: "{} {}".format("\N{RIGHT ANGER BUBBLE}\N{VARIATION SELECTOR-16}", x)
     while True:
         if not messages:
             await ctx.send(tostop(bubble(_("Add your first response."))))
         elif len(messages) > 20:
             await ctx.send(
-                _(
-                    "Sorry, 20 is the maximum limit for the number of {sesstype} messages.".format(
-                        sesstype=sesstype
-                    )
+                _("Sorry, 20 is the maximum limit for the number of {sesstype} messages.").format(
+                    sesstype=sesstype
                 )
             )
             break
@@ -2,7 +2,7 @@ import discord
 from redbot.core.commands import Context
 
 from ..log import log
-from .checks import VALID_USER_BADGES, account_age_checker, now, server_join_age_checker
+from .checks import VALID_USER_BADGES, account_age_checker, server_join_age_checker, utcnow
 from .enums import RaffleComponents
 from .exceptions import (
     InvalidArgument,
@@ -47,7 +47,7 @@ class RaffleManager(object):
 
         # now if something isn't recognised
         for key in self.data.keys():
-            if not key in [x.name for x in RaffleComponents]:
+            if key not in RaffleComponents.__members__:
                 raise UnidentifiedKeyError(f'"{key}" is not a documented condition/block')
 
     @classmethod
@@ -63,15 +63,15 @@ class RaffleManager(object):
 
     @classmethod
     def parse_serverjoinage(cls, ctx: Context, new_join_age: int):
-        guildage = (now - ctx.guild.created_at).days
-        if not server_join_age_checker(ctx, new_join_age):
+        guildage = (utcnow() - ctx.guild.created_at).days
+        if not new_join_age < guildage:
             raise InvalidArgument(
                 "Days must be less than this guild's creation date ({} days)".format(guildage)
             )
 
     def parser(self, ctx: Context):
         if self.account_age:
-            if not isinstance(self.account_age, int):
+            if type(self.account_age) is not int:
                 raise RaffleSyntaxError("(account_age) days must be a number")
             if not account_age_checker(self.account_age):
                 raise RaffleSyntaxError(
@@ -79,7 +79,7 @@ class RaffleManager(object):
                 )
 
         if self.server_join_age:
-            if not isinstance(self.server_join_age, int):
+            if type(self.server_join_age) is not int:
                 raise RaffleSyntaxError("(server_join_age) days must be a number")
             if not server_join_age_checker(ctx, self.server_join_age):
                 raise RaffleSyntaxError(
@@ -87,11 +87,11 @@ class RaffleManager(object):
                 )
 
         if self.maximum_entries:
-            if not isinstance(self.maximum_entries, int):
+            if type(self.maximum_entries) is not int:
                 raise RaffleSyntaxError("(maximum_entries) Maximum entries must be a number")
 
         if self.name:
-            if not isinstance(self.name, str):
+            if type(self.name) is not str:
                 raise RaffleSyntaxError("(name) Name must be in quotation marks")
             if len(self.name) > 25:
                 raise RaffleSyntaxError(
@@ -114,16 +114,16 @@ class RaffleManager(object):
             raise RequiredKeyError("name")
 
         if self.description:
-            if not isinstance(self.description, str):
+            if type(self.description) is not str:
                 raise RaffleSyntaxError("(description) Description must be in quotation marks")
 
         if self.roles_needed_to_enter:
-            if not isinstance(self.roles_needed_to_enter, list):
+            if type(self.roles_needed_to_enter) is not list:
                 raise RaffleSyntaxError(
                     "(roles_needed_to_enter) Roles must be a list of Discord role IDs"
                 )
             for r in self.roles_needed_to_enter:
-                if not isinstance(r, int):
+                if type(r) is not int:
                     raise RaffleSyntaxError(
                         f'(roles_needed_to_enter) "{r}" must be a number (role ID) without quotation marks'
                     )
@@ -131,12 +131,12 @@ class RaffleManager(object):
                     raise UnknownEntityError(r, "role")
 
         if self.badges_needed_to_enter:
-            if not isinstance(self.badges_needed_to_enter, list):
+            if type(self.badges_needed_to_enter) is not list:
                 raise RaffleSyntaxError(
                     "(badges_needed_to_enter) Badges must be a list of Discord badge names"
                 )
             for b in self.badges_needed_to_enter:
-                if not isinstance(b, str):
+                if type(b) is not str:
                     raise RaffleSyntaxError(
                         f'(badges_needed_to_enter) "{b}" must be a Discord badge wrapped in quotation marks'
                     )
@@ -146,12 +146,12 @@ class RaffleManager(object):
                     )
 
         if self.prevented_users:
-            if not isinstance(self.prevented_users, list):
+            if type(self.prevented_users) is not list:
                 raise RaffleSyntaxError(
                     "(prevented_users) Prevented users must be a list of Discord user IDs"
                 )
             for u in self.prevented_users:
-                if not isinstance(u, int):
+                if type(u) is not int:
                     raise RaffleSyntaxError(
                         f'"{u}" must be a number (user ID) without quotation marks'
                     )
@@ -159,12 +159,12 @@ class RaffleManager(object):
                     raise UnknownEntityError(u, "user")
 
         if self.allowed_users:
-            if not isinstance(self.allowed_users, list):
+            if type(self.allowed_users) is not list:
                 raise RaffleSyntaxError(
                     "(allowed_users) Allowed users must be a list of Discord user IDs"
                 )
             for u in self.allowed_users:
-                if not isinstance(u, int):
+                if type(u) is not int:
                     raise RaffleSyntaxError(
                         f'"{u}" must be a number (user ID) without quotation marks'
                     )
@@ -172,30 +172,30 @@ class RaffleManager(object):
                     raise UnknownEntityError(u, "user")
 
         if self.end_message:
-            if not isinstance(self.end_message, (list, str)):
+            if type(self.end_message) not in (list, str):
                 raise RaffleSyntaxError(
                     "(end_message) End message must be in quotation marks, by itself or inside a list"
                 )
-            if isinstance(self.end_message, str):
+            if type(self.end_message) is str:
                 raffle_safe_member_scanner(self.end_message, "end_message")
             else:
                 for m in self.end_message:
-                    if not isinstance(m, str):
+                    if type(m) is not str:
                         raise RaffleSyntaxError(
                             "All end messages must be wrapped by quotation marks"
                         )
                     raffle_safe_member_scanner(m, "end_message")
 
         if self.join_message:
-            if not isinstance(self.join_message, (list, str)):
+            if type(self.join_message) not in (list, str):
                 raise RaffleSyntaxError(
                     "(join_message) Join message must be in quotation marks, by itself or inside a list"
                 )
-            if isinstance(self.join_message, str):
+            if type(self.join_message) is str:
                 raffle_safe_member_scanner(self.join_message, "join_message")
             else:
                 for m in self.join_message:
-                    if not isinstance(m, str):
+                    if type(m) is not str:
                         raise RaffleSyntaxError(
                             "All join messages must be wrapped by quotation marks"
                         )
@@ -203,13 +203,11 @@ class RaffleManager(object):
 
         if self.on_end_action:
             valid_actions = ("end", "remove_winner", "remove_and_prevent_winner", "keep_winner")
-            if not isinstance(self.on_end_action, str) or self.on_end_action not in valid_actions:
+            if type(self.on_end_action) is not str or self.on_end_action not in valid_actions:
                 raise InvalidArgument(
                     "(on_end_action) must be one of 'end', 'remove_winner', 'remove_and_prevent_winner', or 'keep_winner'"
                 )
 
         if self.suspense_timer:
-            if not isinstance(self.suspense_timer, int) or self.suspense_timer not in [
-                *range(0, 11)
-            ]:
+            if type(self.suspense_timer) is not int or self.suspense_timer not in [*range(0, 11)]:
                 raise InvalidArgument("(suspense_timer) must be a number between 0 and 10")
@@ -3,7 +3,7 @@ from typing import Literal
 import discord
 
 from .exceptions import InvalidArgument
-from .formatting import curl
+from .formatting import curl, quote
 
 
 class RaffleSafeMember(object):
@@ -24,7 +24,6 @@ class RaffleSafeMember(object):
 
     def __getattr__(self, attr):
         curled = curl(f"{self.obj}.{attr}")
-        quote = lambda x: f'"{x}"'
         exc = "{} is not valid! {} has no attribute {}.".format(
             curled, self.obj.capitalize(), quote(attr)
         )